@@ -1,24 +1,80 @@
+import os
+from dotenv import load_dotenv
+
+# Load environment variables first, so .env can set the worker and thread counts below
+load_dotenv()
+
+# Split CPU cores between uvicorn workers, and keep BLAS single-threaded so only
+# FAISS's OpenMP pool schedules threads (must be set before numpy/faiss load)
+FAISS_THREADS = max(1, (os.cpu_count() or 1) // int(os.getenv("WEB_CONCURRENCY", "1")))
+os.environ.setdefault("OMP_NUM_THREADS", str(FAISS_THREADS))
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
-import os
-from dotenv import load_dotenv
-from youtube_transcript_api import YouTubeTranscriptApi
-from urllib.parse import urlparse, parse_qs
+from typing import AsyncIterator, List, Optional
+import asyncio
+import json
+import hashlib
+import pickle
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from youtube_transcript_api import NoTranscriptFound, YouTubeTranscriptApi
 import openai
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain_community.vectorstores import FAISS
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_classic.chains import ConversationalRetrievalChain
-from langchain_classic.memory import ConversationBufferMemory
+from langchain_classic.memory import ConversationSummaryBufferMemory
+from langchain_classic.embeddings import CacheBackedEmbeddings
+from langchain_classic.storage import LocalFileStore
 from langchain_core.documents import Document
+from langchain_core.messages import messages_from_dict, messages_to_dict
 import re
+import faiss
+import numpy as np
+import httpx
+import tiktoken
+from redis.asyncio import Redis
 
-# Load environment variables
-load_dotenv()
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Read once at boot; a missing key fails here instead of on the first request
+OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
+
+faiss.omp_set_num_threads(FAISS_THREADS)
+
+# Shared session store (Redis when REDIS_URL is set, otherwise in-process)
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_TTL = int(os.getenv("SESSION_TTL", "3600"))  # seconds
+VIDEO_CACHE_TTL = int(os.getenv("VIDEO_CACHE_TTL", "86400"))  # seconds
+MAX_SESSIONS = int(os.getenv("MAX_SESSIONS", "256"))  # in-process store only
+MAX_CACHE_ENTRIES = int(os.getenv("MAX_CACHE_ENTRIES", "1024"))  # in-process store only
+SESSION_INDEX_KEY = "sessions"  # sorted set of session id -> expiry timestamp
+redis_client: Optional[Redis] = None
 
-app = FastAPI(title="YouTube Video Summarizer API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global redis_client
+    if REDIS_URL:
+        redis_client = Redis.from_url(REDIS_URL)
+    yield
+    if redis_client is not None:
+        await redis_client.aclose()
+    await http_client.aclose()
+
+app = FastAPI(title="YouTube Video Summarizer API", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -29,8 +85,197 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Store for video sessions (in production, use a database)
-video_sessions = {}
+# Fallback store for video sessions when Redis is not configured,
+# kept in least-recently-used order and capped at MAX_SESSIONS
+video_sessions: OrderedDict[str, dict] = OrderedDict()
+
+# Deserialized FAISS stores kept per worker by video id (LRU), so chat turns
+# don't rebuild the index from bytes each time
+MAX_LOADED_VECTORSTORES = int(os.getenv("MAX_LOADED_VECTORSTORES", "64"))
+loaded_vectorstores: OrderedDict[str, tuple] = OrderedDict()  # video id -> (expires_at, store)
+
+# Fallback per-video cache (transcripts, summaries, embeddings) when Redis is not configured,
+# holding (expires_at, value) in least-recently-used order and capped at MAX_CACHE_ENTRIES
+video_cache: OrderedDict[str, tuple] = OrderedDict()
+
+# Chat/summary model (gpt-4o-mini has a 128k-token context window)
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+try:
+    _enc = tiktoken.encoding_for_model(OPENAI_MODEL)
+except KeyError:
+    _enc = tiktoken.get_encoding("o200k_base")
+
+# Context windows (in tokens) by model name prefix; unknown models get the conservative fallback
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4.1": 1047576,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+def context_window(model: str) -> int:
+    """Look up a model's context window, matching the longest known name prefix"""
+    matches = [prefix for prefix in MODEL_CONTEXT_WINDOWS if model.startswith(prefix)]
+    return MODEL_CONTEXT_WINDOWS[max(matches, key=len)] if matches else DEFAULT_CONTEXT_WINDOW
+
+# Transcripts longer than this (in tokens) are summarized map-reduce style. By default
+# it's the model's window minus room for the summary (800) and the prompts, capped
+# so single-pass requests stay a reasonable size
+SUMMARY_MAX_INPUT_TOKENS = int(os.getenv(
+    "SUMMARY_MAX_INPUT_TOKENS",
+    str(min(100000, context_window(OPENAI_MODEL) - 1000))
+))
+SUMMARY_SECTION_TOKENS = 4000
+SUMMARY_SECTION_OVERLAP = 200
+# Max section summaries in flight per worker, to stay under OpenAI rate limits
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", "8"))
+_section_semaphore = asyncio.Semaphore(SUMMARY_MAX_CONCURRENCY)
+
+# Embedding settings (text-embedding-3-small returns 1536-dim vectors)
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIM = 1536
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "./.cache/embeddings/")
+
+# HNSW graph index settings (flat index is used below HNSW_MIN_CHUNKS);
+# stored vectors are int8 scalar-quantized in both cases
+HNSW_MIN_CHUNKS = 64
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 64
+
+# Semantic cache settings for repeated chat questions
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+
+async def _get_session(session_id: str) -> Optional[dict]:
+    """Load a session's serialized state"""
+    if redis_client is None:
+        session = video_sessions.get(session_id)
+        if session is not None:
+            video_sessions.move_to_end(session_id)
+        return session
+    data = await redis_client.get(f"sess:{session_id}")
+    return pickle.loads(data) if data else None
+
+async def _put_session(session_id: str, session: dict):
+    """Persist a session's serialized state"""
+    if redis_client is None:
+        video_sessions[session_id] = session
+        video_sessions.move_to_end(session_id)
+        # Evict least recently used sessions past the cap
+        while len(video_sessions) > MAX_SESSIONS:
+            video_sessions.popitem(last=False)
+    else:
+        await redis_client.set(f"sess:{session_id}", pickle.dumps(session), ex=SESSION_TTL)
+        # Track session expiry times so health checks can count sessions cheaply
+        await redis_client.zadd(SESSION_INDEX_KEY, {session_id: time.time() + SESSION_TTL})
+
+async def _delete_session(session_id: str) -> bool:
+    """Remove a session, returning whether it existed"""
+    if redis_client is None:
+        return video_sessions.pop(session_id, None) is not None
+    await redis_client.zrem(SESSION_INDEX_KEY, session_id)
+    return await redis_client.delete(f"sess:{session_id}") > 0
+
+async def _count_sessions() -> int:
+    if redis_client is None:
+        return len(video_sessions)
+    # Cached videos share the database, so count the session index instead of keys
+    await redis_client.zremrangebyscore(SESSION_INDEX_KEY, "-inf", time.time())
+    return await redis_client.zcard(SESSION_INDEX_KEY)
+
+async def _get_cached(key: str):
+    """Look up per-video work shared across sessions"""
+    if redis_client is None:
+        entry = video_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del video_cache[key]
+            return None
+        video_cache.move_to_end(key)
+        return value
+    data = await redis_client.get(key)
+    return pickle.loads(data) if data else None
+
+async def _set_cached(key: str, value):
+    if redis_client is None:
+        # Same expiry as Redis, plus an LRU cap so memory stays bounded
+        video_cache[key] = (time.monotonic() + VIDEO_CACHE_TTL, value)
+        video_cache.move_to_end(key)
+        while len(video_cache) > MAX_CACHE_ENTRIES:
+            video_cache.popitem(last=False)
+    else:
+        await redis_client.set(key, pickle.dumps(value), ex=VIDEO_CACHE_TTL)
+
+# Map-reduce summarization prompts for long transcripts
+MAP_PROMPT = "Summarize the key points of this section of a video transcript:"
+REDUCE_PROMPT = "Please combine these section summaries of a video transcript into one summary of the whole video:"
+
+# Recent chat turns kept verbatim before older ones are summarized
+MEMORY_MAX_TOKENS = 512
+
+# Tag identifying the answering LLM when streaming chain events
+ANSWER_TAG = "answer"
+
+# Pooled OpenAI clients shared by all requests (one HTTP/2 connection pool)
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+openai_client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+embeddings = OpenAIEmbeddings(
+    model=EMBEDDING_MODEL,
+    openai_api_key=OPENAI_API_KEY,
+    http_async_client=http_client
+)
+# Chunk embeddings persisted on disk, keyed by SHA-256 of the chunk text; cache
+# misses are still sent to OpenAI in batched requests
+cached_embeddings = CacheBackedEmbeddings.from_bytes_store(
+    embeddings,
+    LocalFileStore(EMBEDDING_CACHE_DIR),
+    namespace=EMBEDDING_MODEL,
+    key_encoder="sha256"
+)
+# Plain LLM for memory summarization and question rephrasing
+chat_llm = ChatOpenAI(
+    model_name=OPENAI_MODEL,
+    temperature=0.3,  # Lower temperature for more accurate answers
+    openai_api_key=OPENAI_API_KEY,
+    http_async_client=http_client
+)
+# Only the answering LLM's tokens are streamed to the client
+answer_llm = ChatOpenAI(
+    model_name=OPENAI_MODEL,
+    temperature=0.3,
+    openai_api_key=OPENAI_API_KEY,
+    http_async_client=http_client,
+    streaming=True,
+    tags=[ANSWER_TAG]
+)
+
+# YouTube URL parsing, compiled once at import
+_YT_RE = re.compile(r"(?:youtu\.be/|youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|shorts/))([A-Za-z0-9_-]{11})")
+_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+
+# Sentence ends (punctuation, optional closing quote/bracket, then whitespace)
+_SENT_RE = re.compile(r"[.!?]+[\"')\]]*\s+")
+
+# Set to use LangChain's RecursiveCharacterTextSplitter instead of fast_split (for regression checks)
+USE_LANGCHAIN_SPLITTER = os.getenv("USE_LANGCHAIN_SPLITTER", "").lower() in ("1", "true", "yes")
+
+def sse_event(event: str, data: dict) -> str:
+    """Format a server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def event_stream_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 class VideoRequest(BaseModel):
     video_url: str
@@ -39,22 +284,13 @@ class ChatRequest(BaseModel):
     session_id: str
     question: str
 
-class ChatResponse(BaseModel):
-    answer: str
-    session_id: str
-
-def extract_video_id(url: str) -> str:
+def extract_video_id(url: str) -> Optional[str]:
     """Extract video ID from YouTube URL"""
-    # Handle various YouTube URL formats
-    if "youtu.be" in url:
-        return url.split("/")[-1].split("?")[0]
-    elif "youtube.com" in url:
-        parsed = urlparse(url)
-        if parsed.path == "/watch":
-            return parse_qs(parsed.query).get("v", [None])[0]
-        elif parsed.path.startswith("/embed/"):
-            return parsed.path.split("/")[2]
-    return None
+    # Handles youtu.be/, watch?v=, embed/ and shorts/ URLs, or a bare video ID
+    if len(url) == 11 and _ID_RE.fullmatch(url):
+        return url
+    match = _YT_RE.search(url)
+    return match.group(1) if match else None
 
 def get_transcript(video_id: str) -> str:
     """Fetch transcript from YouTube video"""
@@ -74,26 +310,38 @@ def get_transcript(video_id: str) -> str:
         # Try to get transcript in preferred order: English, then any available language
         preferred_languages = ['en', 'en-US', 'en-GB', 'hi', 'es', 'fr', 'de', 'pt', 'ja', 'ko', 'zh', 'ar']
         
-        result = None
-        
-        # Try preferred languages first
+        # Order candidates from the listing instead of one fetch attempt per language:
+        # preferred languages first, then every other listed transcript
+        candidates = []
         for lang in preferred_languages:
             try:
-                result = api.fetch(video_id, languages=[lang])
-                break  # Successfully fetched, exit loop
-            except Exception:
-                continue  # Try next language
+                transcript_info = available_transcripts.find_transcript([lang])
+            except NoTranscriptFound:
+                continue
+            if transcript_info not in candidates:
+                candidates.append(transcript_info)
+        candidates += [t for t in available_transcripts if t not in candidates]
         
-        # If still no result, try to get ANY available transcript
-        if result is None:
+        if not candidates:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Could not retrieve any transcript for this video. Available transcripts: {str(available_transcripts)}. Please try a different video with captions enabled."
+            )
+        
+        # Fall back to the next candidate if fetching one fails
+        result = None
+        for candidate in candidates:
             try:
-                # Get the first available transcript (any language)
-                result = api.fetch(video_id, languages=[])  # Empty list means any language
+                result = candidate.fetch()
+                break
             except Exception as e:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Could not retrieve any transcript for this video. Available transcripts: {str(available_transcripts)}. Please try a different video with captions enabled."
-                )
+                fetch_error = e
+        
+        if result is None:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Could not fetch any of the available transcripts for this video. Available transcripts: {str(available_transcripts)}. Error: {str(fetch_error)}"
+            )
         
         # Extract text from snippets
         transcript = " ".join([snippet.text for snippet in result.snippets])
@@ -111,42 +359,129 @@ def get_transcript(video_id: str) -> str:
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Unexpected error fetching transcript: {str(e)}")
 
-def summarize_text(text: str) -> str:
-    """Generate summary using OpenAI with smart chunking for long transcripts"""
+def fast_split(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
+    """Split prose into overlapping chunks of at most chunk_size characters, ending on sentence boundaries"""
+    if len(text) <= chunk_size:
+        return [text] if text.strip() else []
+    
+    # All sentence ends in one regex pass; each chunk end is then a binary search
+    boundaries = np.array([m.end() for m in _SENT_RE.finditer(text)], dtype=np.int64)
+    
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + chunk_size
+        if end >= len(text):
+            end = len(text)
+        else:
+            # Snap back to the last sentence end in the window; auto-generated captions
+            # often lack punctuation, so fall back to the last space, then a hard cut
+            i = np.searchsorted(boundaries, end, side="right") - 1
+            if i >= 0 and boundaries[i] > start + overlap:
+                end = int(boundaries[i])
+            else:
+                space = text.rfind(" ", start + overlap, end)
+                if space != -1:
+                    end = space
+        
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= len(text):
+            break
+        
+        # Start the overlap on a sentence start, or at least a word start, so
+        # chunks don't begin mid-word; it must still land after the previous start
+        next_start = end - overlap
+        j = np.searchsorted(boundaries, next_start, side="left")
+        if j < len(boundaries) and boundaries[j] < end:
+            next_start = int(boundaries[j])
+        else:
+            space = text.find(" ", next_start, end)
+            if space != -1:
+                next_start = space + 1
+        start = max(next_start, start + 1)
+    return chunks
+
+def split_text(text: str, chunk_size: int, overlap: int) -> List[str]:
+    if USE_LANGCHAIN_SPLITTER:
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=overlap,
+            length_function=len
+        )
+        return text_splitter.split_text(text)
+    return fast_split(text, chunk_size, overlap)
+
+async def summarize_section(chunk: str) -> str:
+    """Summarize one section of a long transcript, reusing cached results for identical text"""
+    # Keyed by SHA-256 of the section text, in the shared (bounded or Redis) video cache
+    key = f"section:{hashlib.sha256(chunk.encode('utf-8')).hexdigest()}"
+    cached_summary = await _get_cached(key)
+    if cached_summary is not None:
+        return cached_summary
+    
+    async with _section_semaphore:
+        response = await openai_client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[{"role": "user", "content": f"{MAP_PROMPT}\n\n{chunk}"}],
+            max_tokens=200
+        )
+    summary = response.choices[0].message.content
+    await _set_cached(key, summary)
+    return summary
+
+async def summarize_text(text: str, video_id: str) -> AsyncIterator[str]:
+    """Stream a summary from OpenAI with smart chunking for long transcripts"""
     try:
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        cached_summary = await _get_cached(f"summary:{video_id}")
+        if cached_summary is not None:
+            yield cached_summary
+            return
         
-        # Calculate max input length (GPT-3.5-turbo has ~4096 token limit)
-        # Roughly 1 token = 4 characters, leave room for system prompt and response
-        max_chars = 12000  # ~3000 tokens for input
+        # Count real tokens rather than estimating from characters; transcripts are
+        # plain text, so special-token strings like <|endoftext|> are encoded as text.
+        # Encoding a long transcript is CPU-bound, keep it off the event loop
+        tokens = await asyncio.to_thread(_enc.encode, text, disallowed_special=())
         
-        # If transcript is too long, intelligently truncate
-        if len(text) > max_chars:
-            # Take beginning, middle, and end to capture full context
-            chunk_size = max_chars // 3
-            beginning = text[:chunk_size]
-            middle_start = (len(text) - chunk_size) // 2
-            middle = text[middle_start:middle_start + chunk_size]
-            end = text[-chunk_size:]
+        # If transcript is too long, summarize each section in parallel (map)
+        # and then combine the section summaries (reduce) so nothing is dropped
+        if len(tokens) > SUMMARY_MAX_INPUT_TOKENS:
+            # Slice sections by token index so each one fits the model exactly; stop
+            # before a last section that would only repeat the previous overlap
+            step = SUMMARY_SECTION_TOKENS - SUMMARY_SECTION_OVERLAP
+            chunks = await asyncio.to_thread(
+                lambda: [
+                    _enc.decode(tokens[i:i + SUMMARY_SECTION_TOKENS])
+                    for i in range(0, len(tokens) - SUMMARY_SECTION_OVERLAP, step)
+                ]
+            )
+            section_summaries = await asyncio.gather(
+                *[summarize_section(chunk) for chunk in chunks]
+            )
             
-            text_to_summarize = f"{beginning}\n\n[...content omitted...]\n\n{middle}\n\n[...content omitted...]\n\n{end}"
-            transcript_note = f"\n\nNote: This is a long video ({len(text):,} characters). Summary based on key sections."
+            prompt = f"{REDUCE_PROMPT}\n\n" + "\n\n".join(section_summaries)
         else:
-            text_to_summarize = text
-            transcript_note = ""
+            prompt = f"Please summarize the following video transcript:\n\n{text}"
         
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        stream = await openai_client.chat.completions.create(
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that summarizes YouTube video transcripts. Provide a clear, comprehensive summary with key points and main takeaways."},
-                {"role": "user", "content": f"Please summarize the following video transcript:\n\n{text_to_summarize}"}
+                {"role": "user", "content": prompt}
             ],
             max_tokens=800,  # Increased for better summaries
-            temperature=0.7
+            temperature=0.7,
+            stream=True
         )
         
-        summary = response.choices[0].message.content
-        return summary + transcript_note
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                yield chunk.choices[0].delta.content
+        
+        await _set_cached(f"summary:{video_id}", "".join(parts))
         
     except Exception as e:
         # More detailed error handling
@@ -158,49 +493,140 @@ def summarize_text(text: str) -> str:
             )
         raise HTTPException(status_code=500, detail=f"Summarization failed: {error_msg}")
 
-def create_vector_store(transcript: str, session_id: str):
-    """Create vector store for RAG"""
-    try:
-        # Split text into chunks
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            length_function=len
-        )
-        
-        documents = [Document(page_content=transcript)]
-        texts = text_splitter.split_documents(documents)
-        
-        # Create embeddings and vector store
-        embeddings = OpenAIEmbeddings(openai_api_key=os.getenv("OPENAI_API_KEY"))
-        vectorstore = FAISS.from_documents(texts, embeddings)
-        
-        # Create conversational chain
-        memory = ConversationBufferMemory(
-            memory_key="chat_history",
-            return_messages=True,
-            output_key="answer"
-        )
-        
-        llm = ChatOpenAI(
-            model_name="gpt-3.5-turbo",
-            temperature=0.3,  # Lower temperature for more accurate answers
-            openai_api_key=os.getenv("OPENAI_API_KEY")
+def build_faiss_index(vectors: np.ndarray) -> faiss.Index:
+    """Build a quantized FAISS index over chunk embeddings, using HNSW for longer transcripts"""
+    # OpenMP thread settings are per calling thread, and this runs in a worker thread
+    faiss.omp_set_num_threads(FAISS_THREADS)
+    # OpenAI embeddings are unit length, so inner product ranks like cosine similarity
+    if len(vectors) < HNSW_MIN_CHUNKS:
+        # Exact (int8) search is cheap enough for short videos
+        index = faiss.IndexScalarQuantizer(
+            EMBEDDING_DIM, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
         )
-        
-        qa_chain = ConversationalRetrievalChain.from_llm(
-            llm=llm,
-            retriever=vectorstore.as_retriever(search_kwargs={"k": 5}),  # Retrieve more context
-            memory=memory,
-            return_source_documents=True
+    else:
+        # Sub-linear graph search over int8 codes, however long the transcript
+        index = faiss.IndexHNSWSQ(
+            EMBEDDING_DIM, faiss.ScalarQuantizer.QT_8bit, HNSW_M, faiss.METRIC_INNER_PRODUCT
         )
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+    index.train(vectors)
+    index.add(vectors)
+    return index
+
+async def load_vectorstore(video_id: str) -> FAISS:
+    """Get a video's LangChain FAISS store, deserializing its index only on a cache miss"""
+    entry = loaded_vectorstores.get(video_id)
+    if entry is not None and entry[0] >= time.monotonic():
+        loaded_vectorstores.move_to_end(video_id)
+        return entry[1]
+    
+    embedded = await get_embedded_transcript(video_id)
+    docs = embedded["docs"]
+    vectorstore = FAISS(
+        embedding_function=embeddings,
+        index=faiss.deserialize_index(embedded["index_bytes"]),
+        docstore=InMemoryDocstore({str(i): Document(page_content=text) for i, text in enumerate(docs)}),
+        index_to_docstore_id={i: str(i) for i in range(len(docs))},
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+    )
+    
+    # Stores are only read during chat, so sessions on the same video share one;
+    # it expires with the cached embeddings so it never outlives a re-embed
+    loaded_vectorstores[video_id] = (time.monotonic() + VIDEO_CACHE_TTL, vectorstore)
+    while len(loaded_vectorstores) > MAX_LOADED_VECTORSTORES:
+        loaded_vectorstores.popitem(last=False)
+    return vectorstore
+
+def load_memory(session: dict) -> ConversationSummaryBufferMemory:
+    """Rebuild conversation memory from a session's stored chat history"""
+    # Older turns are folded into a running summary so prompts stay bounded
+    memory = ConversationSummaryBufferMemory(
+        llm=chat_llm,
+        max_token_limit=MEMORY_MAX_TOKENS,
+        memory_key="chat_history",
+        return_messages=True,
+        output_key="answer"
+    )
+    memory.chat_memory.messages = messages_from_dict(session["chat_history"])
+    memory.moving_summary_buffer = session["chat_summary"]
+    return memory
+
+def add_to_qa_cache(session: dict, vector: np.ndarray, question: str, answer: str):
+    """Append a question/answer pair to the session's semantic cache"""
+    # Re-read the cache and update index and entries together, with no await in
+    # between, so overlapping turns on a live session can't misalign rows and answers
+    qa_cache = session["qa_cache"]
+    cache_index = faiss.deserialize_index(qa_cache["index_bytes"])
+    cache_index.add(vector)
+    qa_cache["index_bytes"] = faiss.serialize_index(cache_index)
+    qa_cache["entries"].append((question, answer))
+
+def build_qa_chain(vectorstore: FAISS, memory: ConversationSummaryBufferMemory) -> ConversationalRetrievalChain:
+    # The chain only calls condense_question_llm when there is chat history, so the
+    # first question in a session already costs a single LLM call. Follow-ups still
+    # need rephrasing, since questions like "what about the second one?" can't be
+    # retrieved as-is.
+    return ConversationalRetrievalChain.from_llm(
+        llm=answer_llm,
+        condense_question_llm=chat_llm,
+        retriever=vectorstore.as_retriever(search_kwargs={"k": 5}),  # Retrieve more context
+        memory=memory,
+        return_source_documents=True
+    )
+
+async def embed_transcript(transcript: str) -> dict:
+    """Split and embed a transcript, returning its chunks and serialized FAISS index"""
+    # Split text into chunks (wrapped as Documents only when the store is loaded)
+    raw_texts = split_text(transcript, chunk_size=1000, overlap=200)
+    
+    # Only chunks not embedded before are sent to OpenAI
+    vectors = np.array(await cached_embeddings.aembed_documents(raw_texts), dtype=np.float32)
+    
+    # Index build is CPU-bound, keep it off the event loop
+    index = await asyncio.to_thread(build_faiss_index, vectors)
+    
+    return {
+        "docs": raw_texts,
+        "index_bytes": faiss.serialize_index(index)
+    }
+
+async def get_cached_transcript(video_id: str) -> str:
+    """Get a video's transcript, reusing it if this video was seen recently"""
+    transcript = await _get_cached(f"transcript:{video_id}")
+    if transcript is None:
+        # youtube-transcript-api is blocking, keep it off the event loop
+        transcript = await asyncio.to_thread(get_transcript, video_id)
+        await _set_cached(f"transcript:{video_id}", transcript)
+    return transcript
+
+async def get_embedded_transcript(video_id: str, transcript: Optional[str] = None) -> dict:
+    """Get a video's chunks and serialized index from the shared cache, re-embedding if it expired"""
+    embedded = await _get_cached(f"emb:{video_id}")
+    if embedded is None:
+        if transcript is None:
+            transcript = await get_cached_transcript(video_id)
+        embedded = await embed_transcript(transcript)
+        await _set_cached(f"emb:{video_id}", embedded)
+    return embedded
+
+async def create_vector_store(transcript: str, session_id: str, video_id: str):
+    """Create vector store for RAG"""
+    try:
+        # Embed once per video; sessions only reference emb:{video_id} read-only
+        await get_embedded_transcript(video_id, transcript)
         
-        # Store in session
-        video_sessions[session_id] = {
-            "vectorstore": vectorstore,
-            "qa_chain": qa_chain,
-            "transcript": transcript
-        }
+        # Sessions hold only per-conversation state, so each chat turn moves little data
+        await _put_session(session_id, {
+            "video_id": video_id,
+            "chat_history": [],
+            "chat_summary": "",
+            # Semantic cache: question embeddings (inner product on normalized vectors = cosine)
+            "qa_cache": {
+                "index_bytes": faiss.serialize_index(faiss.IndexFlatIP(EMBEDDING_DIM)),
+                "entries": []  # (question, answer) pairs, parallel to index rows
+            }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Vector store creation failed: {str(e)}")
@@ -211,78 +637,149 @@ async def root():
 
 @app.post("/api/summarize")
 async def summarize_video(request: VideoRequest):
-    """Summarize YouTube video and prepare for Q&A"""
+    """Summarize YouTube video and prepare for Q&A, streaming the summary as server-sent events"""
     try:
         # Extract video ID
         video_id = extract_video_id(request.video_url)
         if not video_id:
             raise HTTPException(status_code=400, detail="Invalid YouTube URL")
         
-        # Get transcript
-        transcript = get_transcript(video_id)
-        
-        # Generate summary
-        summary = summarize_text(transcript)
+        # Get transcript, reusing it if this video was seen recently
+        transcript = await get_cached_transcript(video_id)
         
         # Create session ID
-        session_id = f"session_{video_id}_{len(video_sessions)}"
-        
-        # Create vector store for RAG
-        create_vector_store(transcript, session_id)
-        
-        return {
-            "summary": summary,
-            "session_id": session_id,
-            "video_id": video_id,
-            "transcript_length": len(transcript)
-        }
+        session_id = f"session_{video_id}_{uuid.uuid4().hex[:8]}"
         
     except HTTPException as he:
         raise he
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing video: {str(e)}")
+    
+    async def events():
+        # Build the vector store for RAG while the summary streams
+        vector_store_task = asyncio.create_task(create_vector_store(transcript, session_id, video_id))
+        try:
+            yield sse_event("meta", {
+                "video_id": video_id,
+                "transcript_length": len(transcript)
+            })
+            
+            async for token in summarize_text(transcript, video_id):
+                yield sse_event("token", {"text": token})
+            
+            # Session is only usable for chat once the vector store is ready
+            await vector_store_task
+            yield sse_event("done", {"session_id": session_id})
+            
+        except HTTPException as he:
+            yield sse_event("error", {"detail": he.detail})
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error processing video: {str(e)}"})
+        finally:
+            if not vector_store_task.done():
+                vector_store_task.cancel()
+    
+    return event_stream_response(events())
 
-@app.post("/api/chat", response_model=ChatResponse)
+@app.post("/api/chat")
 async def chat_about_video(request: ChatRequest):
-    """Answer questions about the video using RAG - fully context-aware"""
+    """Answer questions about the video using RAG - fully context-aware, streamed as server-sent events"""
     try:
-        if request.session_id not in video_sessions:
+        session = await _get_session(request.session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found. Please summarize a video first.")
 
-        session = video_sessions[request.session_id]
-        qa_chain = session["qa_chain"]
+        memory = load_memory(session)
         
-        # Always use RAG chain for better context-aware answers
-        # The chain has access to the full video transcript and can answer intelligently
-        result = qa_chain({"question": request.question})
-        answer = result["answer"]
-
-        return ChatResponse(
-            answer=answer,
-            session_id=request.session_id
-        )
+        # Check semantic cache for a near-duplicate question
+        vector = np.array([await embeddings.aembed_query(request.question)], dtype=np.float32)
+        faiss.normalize_L2(vector)
+        
+        qa_cache = session["qa_cache"]
+        cache_index = faiss.deserialize_index(qa_cache["index_bytes"])
+        cached_answer = None
+        if cache_index.ntotal > 0:
+            scores, ids = cache_index.search(vector, 1)
+            if scores[0][0] > SEMANTIC_CACHE_THRESHOLD:
+                cached_answer = qa_cache["entries"][ids[0][0]][1]
 
     except HTTPException as he:
         raise he
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error answering question: {str(e)}")
+    
+    async def events():
+        try:
+            if cached_answer is not None:
+                # Keep conversation memory in sync so follow-ups still have context
+                await memory.asave_context({"question": request.question}, {"answer": cached_answer})
+                yield sse_event("token", {"text": cached_answer})
+            else:
+                # Always use RAG chain for better context-aware answers
+                # The chain has access to the full video transcript and can answer intelligently
+                qa_chain = build_qa_chain(await load_vectorstore(session["video_id"]), memory)
+                tokens = []
+                async for event in qa_chain.astream_events({"question": request.question}, version="v2"):
+                    if event["event"] == "on_chat_model_stream" and ANSWER_TAG in event.get("tags", []):
+                        token = event["data"]["chunk"].content
+                        if token:
+                            tokens.append(token)
+                            yield sse_event("token", {"text": token})
+                
+                # Remember this answer for future near-duplicate questions; an empty
+                # answer would otherwise be replayed for every similar question
+                answer = "".join(tokens)
+                if answer:
+                    add_to_qa_cache(session, vector, request.question, answer)
+            
+            # Persist updated memory and cache
+            session["chat_history"] = messages_to_dict(memory.chat_memory.messages)
+            session["chat_summary"] = memory.moving_summary_buffer
+            await _put_session(request.session_id, session)
+            yield sse_event("done", {"session_id": request.session_id})
+            
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error answering question: {str(e)}"})
+    
+    return event_stream_response(events())
 
 @app.delete("/api/session/{session_id}")
 async def clear_session(session_id: str):
     """Clear a session"""
-    if session_id in video_sessions:
-        del video_sessions[session_id]
+    if await _delete_session(session_id):
         return {"message": "Session cleared successfully"}
     else:
         raise HTTPException(status_code=404, detail="Session not found")
 
+def _peak_memory_mb() -> Optional[float]:
+    """Peak resident memory of this worker"""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(max_rss / divisor, 1)
+
 @app.get("/api/health")
 async def health_check():
     return {
         "status": "healthy",
-        "active_sessions": len(video_sessions)
+        "active_sessions": await _count_sessions(),
+        "memory_mb": _peak_memory_mb(),
+        "faiss_threads": faiss.omp_get_max_threads()
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))  # Use Redis (REDIS_URL) to share sessions across workers
+    # Workers need an import string to load the app themselves; a single process
+    # serves this module's app directly instead of importing it a second time
+    # (uvloop is not available on Windows)
+    uvicorn.run(
+        app if workers == 1 else "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers
+    )
@@ -69,6 +69,51 @@ function extractVideoId(url) {
     return (match && match[7].length === 11) ? match[7] : null;
 }
 
+function renderText(text) {
+    return `<p>${text.replace(/\n/g, '<br>')}</p>`;
+}
+
+// Read a server-sent event stream from a fetch response, calling onEvent(name, data) per event
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        
+        buffer += decoder.decode(value, { stream: true });
+        const rawEvents = buffer.split('\n\n');
+        buffer = rawEvents.pop();  // Keep any incomplete event for the next read
+        
+        for (const rawEvent of rawEvents) {
+            let eventName = 'message';
+            let data = '';
+            for (const line of rawEvent.split('\n')) {
+                if (line.startsWith('event: ')) eventName = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            }
+            if (data) onEvent(eventName, JSON.parse(data));
+        }
+    }
+}
+
+// Provide helpful messages for common summarize errors
+function summarizeErrorMessage(detail) {
+    let errorMessage = detail || 'Failed to summarize video';
+    
+    if (errorMessage.includes('too long')) {
+        errorMessage += '\n\nTip: Try a video under 30 minutes for best results.';
+    } else if (errorMessage.includes('transcript')) {
+        errorMessage += '\n\nMake sure the video has captions/subtitles enabled.';
+    } else if (errorMessage.includes('api_key')) {
+        errorMessage = 'OpenAI API key is not configured. Please check backend .env file.';
+    }
+    
+    return errorMessage;
+}
+
 function createThumbnail(videoId) {
     return `<img src="https://img.youtube.com/vi/${videoId}/maxresdefault.jpg" 
                  onerror="this.src='https://img.youtube.com/vi/${videoId}/hqdefault.jpg'" 
@@ -103,35 +148,28 @@ async function handleSummarize() {
         
         if (!response.ok) {
             const error = await response.json();
-            
-            // Provide helpful messages for common errors
-            let errorMessage = error.detail || 'Failed to summarize video';
-            
-            if (errorMessage.includes('too long')) {
-                errorMessage += '\n\nTip: Try a video under 30 minutes for best results.';
-            } else if (errorMessage.includes('transcript')) {
-                errorMessage += '\n\nMake sure the video has captions/subtitles enabled.';
-            } else if (errorMessage.includes('api_key')) {
-                errorMessage = 'OpenAI API key is not configured. Please check backend .env file.';
-            }
-            
-            throw new Error(errorMessage);
+            throw new Error(summarizeErrorMessage(error.detail));
         }
         
-        const data = await response.json();
-        
-        // Store session ID
-        currentSessionId = data.session_id;
-        
-        // Display results
-        displaySummary(data);
+        let summary = '';
         
-        // Show sections
-        summarySection.style.display = 'block';
-        chatSection.style.display = 'block';
-        
-        // Scroll to summary
-        summarySection.scrollIntoView({ behavior: 'smooth' });
+        await readEventStream(response, (event, data) => {
+            if (event === 'meta') {
+                // Display video info and start filling in the summary
+                displaySummary(data);
+                summarySection.style.display = 'block';
+                summarySection.scrollIntoView({ behavior: 'smooth' });
+            } else if (event === 'token') {
+                summary += data.text;
+                summaryContent.innerHTML = renderText(summary);
+            } else if (event === 'done') {
+                // Store session ID; chat is ready once the video is indexed
+                currentSessionId = data.session_id;
+                chatSection.style.display = 'block';
+            } else if (event === 'error') {
+                throw new Error(summarizeErrorMessage(data.detail));
+            }
+        });
         
     } catch (error) {
         showError(error.message);
@@ -147,8 +185,8 @@ function displaySummary(data) {
     transcriptLength.textContent = data.transcript_length.toLocaleString();
     videoThumbnail.innerHTML = createThumbnail(data.video_id);
     
-    // Set summary content
-    summaryContent.innerHTML = `<p>${data.summary.replace(/\n/g, '<br>')}</p>`;
+    // Summary content streams in afterwards
+    summaryContent.innerHTML = '';
 }
 
 async function handleSendQuestion() {
@@ -187,10 +225,23 @@ async function handleSendQuestion() {
             throw new Error(error.detail || 'Failed to get answer');
         }
         
-        const data = await response.json();
+        // Add bot response to chat as it streams in
+        let answer = '';
+        let answerContent = null;
         
-        // Add bot response to chat
-        addMessage(data.answer, 'bot');
+        await readEventStream(response, (event, data) => {
+            if (event === 'token') {
+                answer += data.text;
+                if (!answerContent) {
+                    answerContent = addMessage(answer, 'bot');
+                } else {
+                    answerContent.innerHTML = renderText(answer);
+                    chatMessages.scrollTop = chatMessages.scrollHeight;
+                }
+            } else if (event === 'error') {
+                throw new Error(data.detail);
+            }
+        });
         
     } catch (error) {
         showError(error.message);
@@ -219,13 +270,15 @@ function addMessage(text, sender) {
     
     const contentDiv = document.createElement('div');
     contentDiv.className = 'message-content';
-    contentDiv.innerHTML = `<p>${text.replace(/\n/g, '<br>')}</p>`;
+    contentDiv.innerHTML = renderText(text);
     
     messageDiv.appendChild(contentDiv);
     chatMessages.appendChild(messageDiv);
     
     // Scroll to bottom
     chatMessages.scrollTop = chatMessages.scrollHeight;
+    
+    return contentDiv;
 }
 
 function resetApp() {